@@ -76,10 +76,7 @@ impl CollisionBox<'_> {
 
         ///// n*sigma*v total collisions
         // vbar is the average _speed_, not the average _velocity_.
-        let mut vsum = 0.0;
-        for i in 0..self.velocities.len() {
-            vsum += self.velocities[i].vel.norm();
-        }
+        let vsum: f64 = self.velocities.iter().map(|v| v.vel.norm()).sum();
         let vbar = vsum / self.velocities.len() as f64;
 
         // number of collisions is N*n*sigma*v*dt, where n is atom density and N is atom number
@@ -147,14 +147,14 @@ impl<'a, T, const N: usize> System<'a> for ApplyEmissionForceSystem<T, N> where
                 match *opt {
                     EmissionForceOption::Off => {}
                     EmissionForceOption::On(configuration) => {
+                        let omega = 2.0 * constant::PI * T::frequency();
+                        let force_one_kick =
+                            constant::HBAR * omega / constant::C / timestep.delta;
                         (&mut force, &transition, &actual_scattered_vector)
                             .par_join()
                             .for_each(|(force, _atom_info, kick)| {
                                 let total: u64 = kick.calculate_total_scattered();
                                 let mut rng = rand::thread_rng();
-                                let omega = 2.0 * constant::PI * T::frequency();
-                                let force_one_kick =
-                                    constant::HBAR * omega / constant::C / timestep.delta;
                                 if total > configuration.explicit_threshold {
                                     // see HSIUNG, HSIUNG,GORDUS,1960, A Closed General Solution of the Probability Distribution Function for
                                     //Three-Dimensional Random Walk Processes*
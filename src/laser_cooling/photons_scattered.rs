@@ -292,6 +292,7 @@ impl<'a, T, const N: usize> System<'a> for CalculateActualPhotonsScatteredSystem
                     (&expected_photons_vector, &mut actual_photons_vector)
                         .par_join()
                         .for_each(|(expected, actual)| {
+                            let mut rng = rand::thread_rng();
                             for index in 0..expected.contents.len() {
                                 let lambda = expected.contents[index].scattered;
                                 actual.contents[index].scattered =
@@ -299,7 +300,7 @@ impl<'a, T, const N: usize> System<'a> for CalculateActualPhotonsScatteredSystem
                                         0.0
                                     } else {
                                         let poisson = Poisson::new(lambda).unwrap();
-                                        let drawn_number = poisson.sample(&mut rand::thread_rng());
+                                        let drawn_number = poisson.sample(&mut rng);
                                         drawn_number as f64
                                     }
                             }
@@ -15,6 +15,12 @@ use std::path::Path;
 extern crate byteorder;
 use byteorder::{LittleEndian, WriteBytesExt};
 
+/// Capacity, in bytes, of the buffer used when writing output files.
+///
+/// Each atom is written with many small writes, so a large buffer keeps the number of
+/// underlying file writes per frame low.
+const OUTPUT_BUFFER_CAPACITY: usize = 1 << 20;
+
 /// A system that writes simulation data to file.
 ///
 /// This system writes data `C` of entities associated with `A` to a file at a defined interval.
@@ -99,7 +105,7 @@ where
         Err(why) => panic!("couldn't open {}: {}", display, why),
         Ok(file) => file,
     };
-    let writer = BufWriter::new(file);
+    let writer = BufWriter::with_capacity(OUTPUT_BUFFER_CAPACITY, file);
     OutputSystem {
         interval,
         atom_flag: PhantomData,
@@ -230,6 +236,16 @@ pub trait BinaryConversion {
     fn data(&self) -> Vec<f64>;
 }
 
+/// Prints files in a compact, little-endian binary [Format](struct.Format.html).
+///
+/// Each frame begins with a header of two `u64` values, the step number `n` and the
+/// number of atoms `atomNumber` in the frame. This is followed by one fixed-size record
+/// per atom, consisting of the [Entity](specs::Entity) generation as an `i32`, the id as
+/// a `u32`, and then the `f64` values returned by [BinaryConversion::data].
+///
+/// Because every record in a frame has the same size, a whole frame can be read back in
+/// a single call using a structured record type, eg for [Position](crate::atom::Position):
+/// `[('gen', '<i4'), ('id', '<u4'), ('vec', '<f8', 3)]`.
 pub struct Binary {}
 impl<C, W> Format<C, W> for Binary
 where
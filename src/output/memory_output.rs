@@ -52,7 +52,9 @@ where
     fn run(&mut self, (entities, data, atoms, step): Self::SystemData) {
         if step.n % self.interval == 0 {
             // Lump the atom vector into memory.
-            let mut vec = Vec::new();
+            // Atom number rarely changes between frames, so size from the previous frame.
+            let capacity = self.payload.last().map_or(0, Vec::len);
+            let mut vec = Vec::with_capacity(capacity);
             for (data, _, _) in (&data, &atoms, &entities).join() {
                 vec.push(data.clone());
             }